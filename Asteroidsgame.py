@@ -1,10 +1,7 @@
 import math
 import random
 import sys
-import tempfile
-import wave
-import struct
-import io
+import array
 import pygame
 
 # -------- Game Config --------
@@ -16,14 +13,27 @@ ASTEROID_SPLIT_FACTOR = 0.55  # fraction of parent radius for children
 ASTEROID_CHILD_VARIANCE = 0.15
 ASTEROID_START_COUNT = 5
 ASTEROID_SPEED_BASE = 1.2
+ASTEROID_SHAPE_VARIANTS = 4  # distinct outlines per radius
 LASER_SPEED = 9.0
+LASER_RADIUS = 3
 LASER_COOLDOWN = 180  # ms
 SHIP_THRUST = 0.18
 SHIP_FRICTION = 0.992
 SHIP_MAX_SPEED = 6.0
+SHIP_RADIUS = 12
 INVULN_TIME = 1500  # ms after death
 LIVES = 3
 
+# movement key bits, combined into the index for THRUST_DIRS
+THRUST_W, THRUST_S, THRUST_A, THRUST_D = 1, 2, 4, 8
+# (forward, sideways) thrust in the ship's frame for each key combination;
+# sideways is positive to the ship's right
+THRUST_DIRS = tuple(
+    (SHIP_THRUST * (bool(m & THRUST_W) - 0.6 * bool(m & THRUST_S)),
+     SHIP_THRUST * 0.6 * (bool(m & THRUST_D) - bool(m & THRUST_A)))
+    for m in range(16)
+)
+
 COLOR_BG = (0, 0, 0)
 COLOR_ASTEROID = (255, 255, 255)
 COLOR_SHIP = (255, 230, 0)
@@ -31,55 +41,74 @@ COLOR_LASER = (0, 255, 0)
 COLOR_UI = (220, 220, 220)
 
 # -------- Simple Audio Synthesis (no assets required) --------
-def synth_tone(filename, seconds=0.12, freq=880.0, volume=0.4, kind="square", fade_out=0.02):
-    """Generate a simple WAV tone and write to filename."""
-    framerate = 44100
+def _render_tone(nframes, framerate, amp, freq, kind, fo):
+    """Render a tone into a 16-bit sample buffer."""
+    sin = math.sin
+    w = 2 * math.pi * freq / framerate
+    # waveform, chosen once rather than per sample
+    if kind == "square":
+        s = [1.0 if sin(w * i) >= 0 else -1.0 for i in range(nframes)]
+    elif kind == "saw":
+        # simple sawtooth
+        step = freq / framerate
+        s = [2.0 * ((i * step) % 1.0) - 1.0 for i in range(nframes)]
+    elif kind == "sine":
+        s = [sin(w * i) for i in range(nframes)]
+    else:
+        s = [0.0] * nframes
+    # simple fade out over the tail only
+    for i in range(max(0, nframes - fo + 1), nframes):
+        s[i] *= (nframes - i) / fo
+    return array.array("h", [int(amp * v) for v in s])
+
+
+def _render_noise(nframes, amp):
+    """Render a decaying noise burst into a 16-bit sample buffer."""
+    rand = random.random
+    # colored-ish noise via averaging, under a gentle linear decay envelope
+    return array.array("h", [
+        int(amp * ((rand() + rand() + rand()) * (2.0 / 3.0) - 1.0) * (1.0 - i / nframes))
+        for i in range(nframes)
+    ])
+
+
+def _make_sound(samples):
+    """Wrap a mono 16-bit buffer as a mixer Sound, matching the mixer's channel count."""
+    channels = pygame.mixer.get_init()[2]
+    if channels > 1:
+        samples = array.array("h", [v for v in samples for _ in range(channels)])
+    return pygame.mixer.Sound(buffer=samples.tobytes())
+
+
+def synth_tone(seconds=0.12, freq=880.0, volume=0.4, kind="square", fade_out=0.02):
+    """Generate a simple tone as a mixer Sound."""
+    framerate = pygame.mixer.get_init()[0]
     amp = int(32767 * volume)
     nframes = int(seconds * framerate)
     fo = int(fade_out * framerate)
-    with wave.open(filename, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)  # 16-bit
-        wf.setframerate(framerate)
-        for i in range(nframes):
-            t = i / framerate
-            # waveform
-            if kind == "square":
-                s = 1.0 if math.sin(2 * math.pi * freq * t) >= 0 else -1.0
-            elif kind == "saw":
-                # simple sawtooth
-                s = 2.0 * ((t * freq) % 1.0) - 1.0
-            elif kind == "sine":
-                s = math.sin(2 * math.pi * freq * t)
-            else:
-                s = 0.0
-            # simple fade out
-            if i > nframes - fo:
-                s *= (nframes - i) / fo
-            wf.writeframesraw(struct.pack("<h", int(amp * s)))
+    return _make_sound(_render_tone(nframes, framerate, amp, freq, kind, fo))
 
 
-def synth_noise_burst(filename, seconds=0.25, volume=0.45):
-    """Generate a noise-burst WAV for 'explosion' feel."""
-    framerate = 44100
+def synth_noise_burst(seconds=0.25, volume=0.45):
+    """Generate a noise-burst Sound for 'explosion' feel."""
+    framerate = pygame.mixer.get_init()[0]
     amp = int(32767 * volume)
     nframes = int(seconds * framerate)
-    with wave.open(filename, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(framerate)
-        for i in range(nframes):
-            # gentle decay envelope
-            env = max(0.0, 1.0 - (i / nframes))
-            # colored-ish noise via averaging
-            r = (random.random() + random.random() + random.random()) / 3.0  # [0,1]
-            s = (r * 2.0 - 1.0) * env
-            wf.writeframesraw(struct.pack("<h", int(amp * s)))
+    return _make_sound(_render_noise(nframes, amp))
 
 
 # -------- Utility --------
 def wrap_position(x, y):
-    return x % WIDTH, y % HEIGHT
+    # per-frame drift is far smaller than the screen, so one compare beats %
+    if x < 0:
+        x += WIDTH
+    elif x >= WIDTH:
+        x -= WIDTH
+    if y < 0:
+        y += HEIGHT
+    elif y >= HEIGHT:
+        y -= HEIGHT
+    return x, y
 
 
 def vec_from_angle(angle, magnitude=1.0):
@@ -90,25 +119,105 @@ def clamp(v, lo, hi):
     return max(lo, min(hi, v))
 
 
+# -------- Spatial Index --------
+class QuadTree:
+    """Quadtree of (item, aabb) pairs used as the collision broad phase.
+
+    Boxes are (x0, y0, x1, y1). An item lives in the deepest node that fully
+    contains its box, so items straddling a split line stay in the parent.
+    """
+
+    def __init__(self, bounds, capacity=4, max_depth=5, depth=0):
+        self.bounds = bounds
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.depth = depth
+        self.items = []
+        self.children = None
+
+    def insert(self, item, aabb):
+        if self.children is not None:
+            child = self._child_for(aabb)
+            if child is not None:
+                child.insert(item, aabb)
+                return
+        self.items.append((item, aabb))
+        if self.children is None and len(self.items) > self.capacity and self.depth < self.max_depth:
+            self._subdivide()
+
+    def query(self, aabb, out=None):
+        """Return items whose box overlaps aabb."""
+        if out is None:
+            out = []
+        qx0, qy0, qx1, qy1 = aabb
+        for item, (x0, y0, x1, y1) in self.items:
+            if x0 <= qx1 and qx0 <= x1 and y0 <= qy1 and qy0 <= y1:
+                out.append(item)
+        if self.children is not None:
+            for child in self.children:
+                x0, y0, x1, y1 = child.bounds
+                if x0 <= qx1 and qx0 <= x1 and y0 <= qy1 and qy0 <= y1:
+                    child.query(aabb, out)
+        return out
+
+    def _subdivide(self):
+        x0, y0, x1, y1 = self.bounds
+        mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+        d = self.depth + 1
+        self.children = [
+            QuadTree((x0, y0, mx, my), self.capacity, self.max_depth, d),
+            QuadTree((mx, y0, x1, my), self.capacity, self.max_depth, d),
+            QuadTree((x0, my, mx, y1), self.capacity, self.max_depth, d),
+            QuadTree((mx, my, x1, y1), self.capacity, self.max_depth, d),
+        ]
+        items, self.items = self.items, []
+        for item, aabb in items:
+            self.insert(item, aabb)
+
+    def _child_for(self, aabb):
+        x0, y0, x1, y1 = self.bounds
+        mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+        ax0, ay0, ax1, ay1 = aabb
+        if ax1 <= mx:
+            col = 0
+        elif ax0 >= mx:
+            col = 1
+        else:
+            return None
+        if ay1 <= my:
+            row = 0
+        elif ay0 >= my:
+            row = 1
+        else:
+            return None
+        return self.children[row * 2 + col]
+
+
 # -------- Game Objects --------
 class Laser:
-    def __init__(self, x, y, vx, vy):
+    def __init__(self, x, y, vx, vy, now):
         self.x, self.y = x, y
         self.vx, self.vy = vx, vy
-        self.radius = 3
         self.alive = True
         self.ttl = 1200  # ms
-        self.birth = pygame.time.get_ticks()
+        self.birth = now
 
-    def update(self, dt):
-        self.x += self.vx
-        self.y += self.vy
-        self.x, self.y = wrap_position(self.x, self.y)
-        if pygame.time.get_ticks() - self.birth > self.ttl:
-            self.alive = False
 
-    def draw(self, surf):
-        pygame.draw.circle(surf, COLOR_LASER, (int(self.x), int(self.y)), self.radius)
+def _asteroid_outline(radius):
+    """Slightly jagged polygon for a classic look, in the asteroid's local frame."""
+    rand = random.random
+    shape = []
+    spikes = max(8, int(radius / 2))
+    for i in range(spikes):
+        ang = (i / spikes) * math.tau
+        r_jitter = radius * (0.85 + rand() * 0.3)
+        shape.append((math.cos(ang) * r_jitter, math.sin(ang) * r_jitter))
+    return shape
+
+
+def _asteroid_extent(radius):
+    # half-size of the sprite: max jitter plus room for the stroke
+    return int(radius * 1.15) + 2
 
 
 class Asteroid:
@@ -116,42 +225,54 @@ class Asteroid:
         self.x, self.y = x, y
         self.radius = radius
         if vx is None or vy is None:
-            ang = random.uniform(0, math.tau)
-            speed = ASTEROID_SPEED_BASE + (ASTEROID_MAX_RADIUS - radius) * 0.02 + random.uniform(-0.3, 0.3)
+            rand = random.random
+            ang = rand() * math.tau
+            speed = ASTEROID_SPEED_BASE + (ASTEROID_MAX_RADIUS - radius) * 0.02 + rand() * 0.6 - 0.3
             self.vx, self.vy = vec_from_angle(ang, speed)
         else:
             self.vx, self.vy = vx, vy
-
-    def update(self, dt):
-        self.x += self.vx
-        self.y += self.vy
-        self.x, self.y = wrap_position(self.x, self.y)
-
-    def draw(self, surf):
-        # Draw a slightly jagged polygon for a classic look
-        points = []
-        spikes = max(8, int(self.radius / 2))
-        for i in range(spikes):
-            ang = (i / spikes) * math.tau
-            r_jitter = self.radius * (0.85 + random.random() * 0.3)
-            px = self.x + math.cos(ang) * r_jitter
-            py = self.y + math.sin(ang) * r_jitter
-            points.append((px, py))
+        self.variant = random.randrange(ASTEROID_SHAPE_VARIANTS)
+        self.extent = _asteroid_extent(radius)
+
+    def wrapped_positions(self, pad):
+        """Return the center plus wrapped copies for each screen edge within pad of it."""
+        x, y = self.x, self.y
+        xs = [x]
+        if x < pad:
+            xs.append(x + WIDTH)
+        elif x > WIDTH - pad:
+            xs.append(x - WIDTH)
+        ys = [y]
+        if y < pad:
+            ys.append(y + HEIGHT)
+        elif y > HEIGHT - pad:
+            ys.append(y - HEIGHT)
+        return [(gx, gy) for gx in xs for gy in ys]
+
+    @staticmethod
+    def render_sprite(radius):
+        """Rasterize a fresh outline into a transparent Surface centered on the asteroid."""
+        e = _asteroid_extent(radius)
+        surf = pygame.Surface((2 * e, 2 * e), pygame.SRCALPHA)
+        points = [(e + dx, e + dy) for dx, dy in _asteroid_outline(radius)]
         pygame.draw.polygon(surf, COLOR_ASTEROID, points, width=2)
+        return surf.convert_alpha()
 
     def split(self):
         """Return list of child asteroids (or empty if too small)."""
         if self.radius <= ASTEROID_MIN_RADIUS:
             return []
         kids = []
-        num_children = random.choice([2, 2, 3])  # bias toward 2
+        parent_speed = math.sqrt(self.vx * self.vx + self.vy * self.vy)
+        rand = random.random
+        num_children = 3 if rand() < 1 / 3 else 2  # bias toward 2
         for _ in range(num_children):
             new_r = max(
                 ASTEROID_MIN_RADIUS,
-                int(self.radius * (ASTEROID_SPLIT_FACTOR + random.uniform(-ASTEROID_CHILD_VARIANCE, ASTEROID_CHILD_VARIANCE)))
+                int(self.radius * (ASTEROID_SPLIT_FACTOR + (rand() * 2.0 - 1.0) * ASTEROID_CHILD_VARIANCE))
             )
-            ang = random.uniform(0, math.tau)
-            speed = (math.hypot(self.vx, self.vy) + 0.5) * (1.0 + random.uniform(-0.2, 0.35))
+            ang = rand() * math.tau
+            speed = (parent_speed + 0.5) * (0.8 + rand() * 0.55)
             vx, vy = vec_from_angle(ang, speed)
             kids.append(Asteroid(self.x, self.y, new_r, vx, vy))
         return kids
@@ -162,39 +283,36 @@ class Ship:
         self.x, self.y = WIDTH / 2, HEIGHT / 2
         self.vx, self.vy = 0.0, 0.0
         self.angle = 0.0
-        self.radius = 12
+        self.radius = SHIP_RADIUS
         self.alive = True
         self.invuln_until = 0
 
-    def reset(self):
+    def reset(self, now):
         self.__init__()
-        self.invuln_until = pygame.time.get_ticks() + INVULN_TIME
+        self.invuln_until = now + INVULN_TIME
 
     def update(self, keys, dt, mouse_pos):
         mx, my = mouse_pos
         self.angle = math.atan2(my - self.y, mx - self.x)
 
-        thrusting = keys[pygame.K_w] or keys[pygame.K_UP]
-        if thrusting:
-            ax, ay = vec_from_angle(self.angle, SHIP_THRUST)
-            self.vx += ax
-            self.vy += ay
+        mask = 0
+        if keys[pygame.K_w] or keys[pygame.K_UP]:
+            mask |= THRUST_W
         if keys[pygame.K_s] or keys[pygame.K_DOWN]:
-            ax, ay = vec_from_angle(self.angle + math.pi, SHIP_THRUST * 0.6)
-            self.vx += ax
-            self.vy += ay
+            mask |= THRUST_S
         if keys[pygame.K_a] or keys[pygame.K_LEFT]:
-            ax, ay = vec_from_angle(self.angle - math.pi / 2, SHIP_THRUST * 0.6)
-            self.vx += ax
-            self.vy += ay
+            mask |= THRUST_A
         if keys[pygame.K_d] or keys[pygame.K_RIGHT]:
-            ax, ay = vec_from_angle(self.angle + math.pi / 2, SHIP_THRUST * 0.6)
-            self.vx += ax
-            self.vy += ay
-
-        speed = math.hypot(self.vx, self.vy)
-        if speed > SHIP_MAX_SPEED:
-            scale = SHIP_MAX_SPEED / speed
+            mask |= THRUST_D
+        if mask:
+            fwd, side = THRUST_DIRS[mask]
+            c, s = math.cos(self.angle), math.sin(self.angle)
+            self.vx += c * fwd - s * side
+            self.vy += s * fwd + c * side
+
+        sp2 = self.vx * self.vx + self.vy * self.vy
+        if sp2 > SHIP_MAX_SPEED * SHIP_MAX_SPEED:
+            scale = SHIP_MAX_SPEED / math.sqrt(sp2)
             self.vx *= scale
             self.vy *= scale
 
@@ -205,7 +323,7 @@ class Ship:
         self.y += self.vy
         self.x, self.y = wrap_position(self.x, self.y)
 
-    def draw(self, surf):
+    def draw(self, surf, now):
         # Ship triangle
         tip = (self.x + math.cos(self.angle) * (self.radius * 1.8),
                self.y + math.sin(self.angle) * (self.radius * 1.8))
@@ -214,23 +332,24 @@ class Ship:
         right = (self.x + math.cos(self.angle - 2.5) * self.radius,
                  self.y + math.sin(self.angle - 2.5) * self.radius)
 
-        if pygame.time.get_ticks() < self.invuln_until:
-            # flicker when invulnerable
-            if (pygame.time.get_ticks() // 120) % 2 == 0:
-                pygame.draw.polygon(surf, COLOR_SHIP, [tip, left, right], width=2)
-        else:
-            pygame.draw.polygon(surf, COLOR_SHIP, [tip, left, right], width=2)
+        # flicker when invulnerable
+        if now >= self.invuln_until or (now // 120) % 2 == 0:
+            return pygame.draw.polygon(surf, COLOR_SHIP, [tip, left, right], width=2)
+        return None
 
-    def can_be_hit(self):
-        return pygame.time.get_ticks() >= self.invuln_until
+    def can_be_hit(self, now):
+        return now >= self.invuln_until
 
 
 # -------- Game --------
 class Game:
     def __init__(self):
+        pygame.mixer.pre_init(44100, -16, 1, 512)
         pygame.init()
         pygame.display.set_caption("Asteroid Destroyer")
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        # pygame 2 ignores these flags for a windowed non-OpenGL display; that is
+        # what lets draw() present partial updates from a persistent screen surface
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF | pygame.HWSURFACE)
         self.clock = pygame.time.Clock()
         self.font = pygame.font.SysFont("consolas", 22)
         self.big_font = pygame.font.SysFont("consolas", 48)
@@ -243,46 +362,38 @@ class Game:
         self.running = True
         self.paused = False
         self.game_over = False
+        self._dirty_rects = None  # rects presented last frame; None forces a full flip
+        self._frozen_drawn = None  # (paused, game_over) of the frozen screen last presented
+        self._asteroid_cache = {}  # (radius, variant) -> pre-rendered Surface
+        self._laser_surf = pygame.Surface((2 * LASER_RADIUS + 1, 2 * LASER_RADIUS + 1), pygame.SRCALPHA)
+        pygame.draw.circle(self._laser_surf, COLOR_LASER, (LASER_RADIUS, LASER_RADIUS), LASER_RADIUS)
+        self._laser_surf = self._laser_surf.convert_alpha()
 
         # Audio
-        pygame.mixer.pre_init(44100, -16, 1, 512)
         pygame.mixer.init()
         self.snd_shoot, self.snd_explode, self.snd_thrust = self._make_sounds()
 
         self._spawn_wave(ASTEROID_START_COUNT)
 
-    def _tmp_wav(self):
-        return tempfile.NamedTemporaryFile(delete=False, suffix=".wav")
-
     def _make_sounds(self):
-        # Create three temporary wav files and load as pygame sounds
-        shoot_file = self._tmp_wav()
-        explode_file = self._tmp_wav()
-        thrust_file = self._tmp_wav()
-        shoot_file.close()
-        explode_file.close()
-        thrust_file.close()
-
-        synth_tone(shoot_file.name, seconds=0.09, freq=920, volume=0.5, kind="square", fade_out=0.02)
-        synth_noise_burst(explode_file.name, seconds=0.3, volume=0.6)
-        synth_tone(thrust_file.name, seconds=0.2, freq=160, volume=0.35, kind="saw", fade_out=0.05)
-
-        snd_shoot = pygame.mixer.Sound(shoot_file.name)
-        snd_explode = pygame.mixer.Sound(explode_file.name)
-        snd_thrust = pygame.mixer.Sound(thrust_file.name)
+        # Synthesize sounds straight into mixer buffers
+        snd_shoot = synth_tone(seconds=0.09, freq=920, volume=0.5, kind="square", fade_out=0.02)
+        snd_explode = synth_noise_burst(seconds=0.3, volume=0.6)
+        snd_thrust = synth_tone(seconds=0.2, freq=160, volume=0.35, kind="saw", fade_out=0.05)
         snd_thrust.set_volume(0.4)
         return snd_shoot, snd_explode, snd_thrust
 
     def _spawn_wave(self, count):
         self.asteroids.clear()
-        margin = 80
+        rand = random.random
+        min_d = 200
+        max_d = min(WIDTH, HEIGHT) / 2
         for _ in range(count):
-            # spawn away from the ship
-            while True:
-                x = random.randrange(margin, WIDTH - margin)
-                y = random.randrange(margin, HEIGHT - margin)
-                if math.hypot(x - self.ship.x, y - self.ship.y) > 200:
-                    break
+            # spawn away from the ship: pick a bearing and a distance directly
+            ang = rand() * math.tau
+            d = min_d + rand() * (max_d - min_d)
+            x = (self.ship.x + math.cos(ang) * d) % WIDTH
+            y = (self.ship.y + math.sin(ang) * d) % HEIGHT
             r = random.randint(ASTEROID_MAX_RADIUS - 15, ASTEROID_MAX_RADIUS)
             self.asteroids.append(Asteroid(x, y, r))
 
@@ -294,14 +405,30 @@ class Game:
         vx, vy = vec_from_angle(self.ship.angle, LASER_SPEED)
         lx = self.ship.x + math.cos(self.ship.angle) * (self.ship.radius * 1.8)
         ly = self.ship.y + math.sin(self.ship.angle) * (self.ship.radius * 1.8)
-        self.lasers.append(Laser(lx, ly, vx, vy))
+        self.lasers.append(Laser(lx, ly, vx, vy, now))
         if self.snd_shoot:
             self.snd_shoot.play()
 
+    def _build_asteroid_tree(self):
+        """Index asteroids by AABB, adding wrapped ghost copies at screen edges."""
+        # ghosts must reach anything tested against them, not just the asteroid's own edge
+        query_pad = max(LASER_RADIUS, SHIP_RADIUS)
+        m = 2 * ASTEROID_MAX_RADIUS + query_pad
+        tree = QuadTree((-m, -m, WIDTH + m, HEIGHT + m))
+        for a in self.asteroids:
+            r = a.radius
+            # laser hit threshold, squared once per asteroid rather than per pair
+            thr = r + LASER_RADIUS
+            thr2 = thr * thr
+            for x, y in a.wrapped_positions(r + query_pad):
+                tree.insert((a, x, y, thr2), (x - r, y - r, x + r, y + r))
+        return tree
+
     def update(self, dt):
         if self.game_over or self.paused:
             return
 
+        now = pygame.time.get_ticks()
         keys = pygame.key.get_pressed()
         mouse_pos = pygame.mouse.get_pos()
 
@@ -312,68 +439,130 @@ class Game:
 
         self.ship.update(keys, dt, mouse_pos)
 
-        # lasers
+        # move lasers, wrapping at the screen edges, and expire old ones
         for l in self.lasers:
-            l.update(dt)
-        self.lasers = [l for l in self.lasers if l.alive]
-
-        # asteroids
+            x, y = l.x + l.vx, l.y + l.vy
+            if x < 0:
+                x += WIDTH
+            elif x >= WIDTH:
+                x -= WIDTH
+            if y < 0:
+                y += HEIGHT
+            elif y >= HEIGHT:
+                y -= HEIGHT
+            l.x, l.y = x, y
+            if now - l.birth > l.ttl:
+                l.alive = False
+        # drop dead lasers in place; order doesn't matter
+        lasers = self.lasers
+        for i in range(len(lasers) - 1, -1, -1):
+            if not lasers[i].alive:
+                lasers[i] = lasers[-1]
+                lasers.pop()
+
+        # move asteroids, wrapping at the screen edges
         for a in self.asteroids:
-            a.update(dt)
+            x, y = a.x + a.vx, a.y + a.vy
+            if x < 0:
+                x += WIDTH
+            elif x >= WIDTH:
+                x -= WIDTH
+            if y < 0:
+                y += HEIGHT
+            elif y >= HEIGHT:
+                y -= HEIGHT
+            a.x, a.y = x, y
+
+        # collisions: lasers vs asteroids (quadtree broad phase)
+        tree = self._build_asteroid_tree()
+        hit = set()
+        lr = LASER_RADIUS
+        for l in self.lasers:
+            lx, ly = l.x, l.y
+            for a, ax, ay, thr2 in tree.query((lx - lr, ly - lr, lx + lr, ly + lr)):
+                if a in hit:
+                    continue
+                dx, dy = ax - lx, ay - ly
+                if dx * dx + dy * dy <= thr2:
+                    l.alive = False
+                    hit.add(a)
+                    break
 
-        # collisions: lasers vs asteroids
+        explosion_this_frame = bool(hit)
         new_asteroids = []
+        spawned = []
         for a in self.asteroids:
-            hit = False
-            for l in self.lasers:
-                if (a.x - l.x) ** 2 + (a.y - l.y) ** 2 <= (a.radius + l.radius) ** 2:
-                    l.alive = False
-                    hit = True
-                    break
-            if hit:
+            if a in hit:
                 self.score += max(1, (ASTEROID_MAX_RADIUS - a.radius) // 5)
                 kids = a.split()
                 if kids:
                     new_asteroids.extend(kids)
-                if self.snd_explode:
-                    self.snd_explode.play()
+                    spawned.extend(kids)
             else:
                 new_asteroids.append(a)
         self.asteroids = new_asteroids
 
         # collisions: ship vs asteroids
-        if self.ship.can_be_hit():
-            for a in self.asteroids:
-                if (a.x - self.ship.x) ** 2 + (a.y - self.ship.y) ** 2 <= (a.radius + self.ship.radius) ** 2:
+        if self.ship.can_be_hit(now):
+            sx, sy, sr = self.ship.x, self.ship.y, self.ship.radius
+            candidates = [(a, ax, ay) for a, ax, ay, _ in tree.query((sx - sr, sy - sr, sx + sr, sy + sr))
+                          if a not in hit]
+            # children split off this frame aren't in the tree yet
+            candidates += [(k, k.x, k.y) for k in spawned]
+            for a, ax, ay in candidates:
+                dx, dy, thr = ax - sx, ay - sy, a.radius + sr
+                if dx * dx + dy * dy <= thr * thr:
                     self.lives -= 1
-                    self.ship.reset()
-                    if self.snd_explode:
-                        self.snd_explode.play()
+                    self.ship.reset(now)
+                    explosion_this_frame = True
                     if self.lives <= 0:
                         self.game_over = True
                     break
 
+        # one explosion sound per frame, however many things blew up
+        if explosion_this_frame and self.snd_explode:
+            self.snd_explode.play()
+
         # next wave?
         if not self.asteroids and not self.game_over:
             # ramp difficulty by increasing count a bit
             next_count = min(12, 5 + (self.score // 15))
             self._spawn_wave(next_count)
 
+    def _asteroid_sprite(self, a):
+        key = (a.radius, a.variant)
+        surf = self._asteroid_cache.get(key)
+        if surf is None:
+            # the outline is only generated on a cache miss
+            surf = self._asteroid_cache[key] = Asteroid.render_sprite(a.radius)
+        return surf
+
     def draw(self):
+        # a paused or game-over scene is static: present it once, then idle
+        frozen = self.paused or self.game_over
+        if frozen and self._frozen_drawn == (self.paused, self.game_over):
+            return
+        now = pygame.time.get_ticks()
         self.screen.fill(COLOR_BG)
 
-        # draw objects
+        # draw objects: sprites go through one batched blits() call;
+        # asteroids over an edge also show on the opposite side, matching collisions
+        blit_list = []
         for a in self.asteroids:
-            a.draw(self.screen)
-        for l in self.lasers:
-            l.draw(self.screen)
-        self.ship.draw(self.screen)
+            sprite, e = self._asteroid_sprite(a), a.extent
+            blit_list += [(sprite, (x - e, y - e)) for x, y in a.wrapped_positions(e)]
+        laser_surf = self._laser_surf
+        blit_list += [(laser_surf, (int(l.x) - LASER_RADIUS, int(l.y) - LASER_RADIUS)) for l in self.lasers]
+        rects = self.screen.blits(blit_list)
+        ship_rect = self.ship.draw(self.screen, now)
+        if ship_rect is not None:
+            rects.append(ship_rect)
 
         # UI
         score_surf = self.font.render(f"Score: {self.score}", True, COLOR_UI)
         lives_surf = self.font.render(f"Lives: {self.lives}", True, COLOR_UI)
-        self.screen.blit(score_surf, (10, 10))
-        self.screen.blit(lives_surf, (10, 38))
+        rects.append(self.screen.blit(score_surf, (10, 10)))
+        rects.append(self.screen.blit(lives_surf, (10, 38)))
 
         if self.paused:
             p = self.big_font.render("PAUSED  (P to resume)", True, (180, 180, 255))
@@ -385,7 +574,13 @@ class Game:
             self.screen.blit(go, (WIDTH // 2 - go.get_width() // 2, HEIGHT // 2 - go.get_height()))
             self.screen.blit(tip, (WIDTH // 2 - tip.get_width() // 2, HEIGHT // 2 + 8))
 
-        pygame.display.flip()
+        if frozen or self._dirty_rects is None:
+            pygame.display.flip()
+        else:
+            # only push what was drawn this frame or needs erasing from the last
+            pygame.display.update(self._dirty_rects + rects)
+        self._frozen_drawn = (self.paused, self.game_over) if frozen else None
+        self._dirty_rects = None if frozen else rects
 
     def handle_events(self):
         for event in pygame.event.get():
@@ -401,6 +596,10 @@ class Game:
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1 and not self.paused and not self.game_over:
                     self.shoot()
+            elif event.type in (pygame.VIDEOEXPOSE, getattr(pygame, "WINDOWEXPOSED", pygame.VIDEOEXPOSE)):
+                # window contents may be lost; repaint everything next frame
+                self._frozen_drawn = None
+                self._dirty_rects = None
 
     def run(self):
         while self.running: